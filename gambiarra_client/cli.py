@@ -11,46 +11,12 @@ from typing import Optional
 
 from dotenv import load_dotenv
 
+from .control import ControlServer
+from .output import Colors, print_banner, print_error, print_info, print_success, print_warning
 from .net.ws import GambiarraClient, ClientConfig, Challenge, TokenMessage, CompleteMessage, ErrorMessage
 from .runners import Runner, GenerateOptions, MockRunner, OllamaRunner, LMStudioRunner
 
 
-# ANSI color codes for terminal output
-class Colors:
-    CYAN = '\033[96m'
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    RED = '\033[91m'
-    GRAY = '\033[90m'
-    BOLD = '\033[1m'
-    END = '\033[0m'
-
-
-def print_banner():
-    """Print startup banner."""
-    print(f"{Colors.BOLD}{Colors.CYAN}\n🎮 Gambiarra LLM Club Client\n{Colors.END}")
-
-
-def print_success(message: str):
-    """Print success message."""
-    print(f"{Colors.GREEN}✓ {message}{Colors.END}")
-
-
-def print_error(message: str):
-    """Print error message."""
-    print(f"{Colors.RED}✗ {message}{Colors.END}")
-
-
-def print_info(message: str):
-    """Print info message."""
-    print(f"{Colors.GRAY}{message}{Colors.END}")
-
-
-def print_warning(message: str):
-    """Print warning message."""
-    print(f"{Colors.YELLOW}{message}{Colors.END}")
-
-
 async def handle_challenge(
     client: GambiarraClient,
     runner: Runner,
@@ -108,6 +74,12 @@ async def handle_challenge(
         if latency_ms_first_token:
             print_info(f"  First token latency: {latency_ms_first_token}ms")
 
+        if runner.last_cached_prompt_tokens:
+            print_info(f"  Cached prompt tokens: {runner.last_cached_prompt_tokens}")
+
+        if runner.last_prompt_eval_saved_ms:
+            print_info(f"  Prompt eval saved: {runner.last_prompt_eval_saved_ms}ms")
+
         # Send completion
         await client.send_complete(CompleteMessage(
             round=challenge.round,
@@ -115,7 +87,7 @@ async def handle_challenge(
             latency_ms_first_token=latency_ms_first_token,
             duration_ms=duration_ms,
             model_info={
-                "name": options.model,
+                "name": client.config.model,
                 "runner": options.runner,
             }
         ))
@@ -130,16 +102,51 @@ async def handle_challenge(
         ))
 
 
-async def main():
-    """Main entry point."""
-    # Load .env file if it exists
+def load_env_file():
+    """Load .env file if it exists."""
     env_path = Path(".env")
     if env_path.exists():
         load_dotenv(env_path)
         print_info("Loaded configuration from .env file\n")
 
+
+async def create_runner(args: argparse.Namespace) -> Runner:
+    """Create the configured runner and test its connection."""
+    runner: Runner
+    if args.runner == "ollama":
+        print_info(f"Using Ollama at {args.ollama_url}")
+        runner = OllamaRunner(args.ollama_url, args.model)
+    elif args.runner == "lmstudio":
+        print_info(f"Using LM Studio at {args.lmstudio_url}")
+        runner = LMStudioRunner(args.lmstudio_url, args.model)
+    elif args.runner == "mock":
+        print_warning("Using Mock runner (simulated tokens)")
+        runner = MockRunner()
+    else:
+        print_error(f"Unknown runner: {args.runner}")
+        sys.exit(1)
+
+    # Test runner
+    try:
+        await runner.test()
+        print_success("Runner connection OK\n")
+    except Exception as e:
+        print_error(f"Runner connection failed: {e}")
+        sys.exit(1)
+
+    return runner
+
+
+async def main():
+    """Main entry point."""
+    load_env_file()
+
     parser = argparse.ArgumentParser(
         description="Cliente para Gambiarra LLM Club Arena",
+        epilog=(
+            "Subcomandos: 'gambiarra-client loadtest-backend PROMPTS' mede a saturação "
+            "do backend local (veja 'gambiarra-client loadtest-backend --help')"
+        ),
         formatter_class=argparse.ArgumentDefaultsHelpFormatter
     )
 
@@ -153,6 +160,7 @@ async def main():
     parser.add_argument("--max-tokens", type=int, default=int(os.getenv("MAX_TOKENS", "400")), help="Max tokens")
     parser.add_argument("--ollama-url", default=os.getenv("OLLAMA_URL", "http://localhost:11434"), help="Ollama API URL")
     parser.add_argument("--lmstudio-url", default=os.getenv("LMSTUDIO_URL", "http://localhost:1234"), help="LM Studio API URL")
+    parser.add_argument("--control-port", type=int, default=int(os.getenv("CONTROL_PORT", "0")), help="Local control socket port for model hot-swap (0 disables)")
 
     args = parser.parse_args()
 
@@ -167,27 +175,7 @@ async def main():
     print_banner()
 
     # Create runner
-    runner: Runner
-    if args.runner == "ollama":
-        print_info(f"Using Ollama at {args.ollama_url}")
-        runner = OllamaRunner(args.ollama_url, args.model)
-    elif args.runner == "lmstudio":
-        print_info(f"Using LM Studio at {args.lmstudio_url}")
-        runner = LMStudioRunner(args.lmstudio_url, args.model)
-    elif args.runner == "mock":
-        print_warning("Using Mock runner (simulated tokens)")
-        runner = MockRunner()
-    else:
-        print_error(f"Unknown runner: {args.runner}")
-        sys.exit(1)
-
-    # Test runner
-    try:
-        await runner.test()
-        print_success("Runner connection OK\n")
-    except Exception as e:
-        print_error(f"Runner connection failed: {e}")
-        sys.exit(1)
+    runner = await create_runner(args)
 
     # Create client
     client = GambiarraClient(ClientConfig(
@@ -207,9 +195,12 @@ async def main():
         print_error(f"Failed to connect: {e}")
         sys.exit(1)
 
-    # Handle challenges
+    # Handle challenges, one round at a time so model swaps happen between rounds
+    round_lock = asyncio.Lock()
+
     async def on_challenge(challenge: Challenge):
-        await handle_challenge(client, runner, challenge, args)
+        async with round_lock:
+            await handle_challenge(client, runner, challenge, args)
 
     client.on("challenge", on_challenge)
 
@@ -220,6 +211,17 @@ async def main():
 
     client.on("close", on_close)
 
+    # Start control socket
+    control: Optional[ControlServer] = None
+    if args.control_port:
+        control = ControlServer(args.control_port, client, runner, round_lock)
+        try:
+            await control.start()
+            print_success(f"Control socket listening on 127.0.0.1:{args.control_port}")
+        except OSError as e:
+            print_error(f"Failed to start control socket: {e}")
+            sys.exit(1)
+
     print_success("Ready and waiting for challenges...")
 
     # Keep running
@@ -228,12 +230,19 @@ async def main():
             await asyncio.sleep(1)
     except KeyboardInterrupt:
         print_warning("\n\nShutting down...")
+        if control:
+            await control.stop()
         await client.disconnect()
         sys.exit(0)
 
 
 def run():
     """Entry point for CLI."""
+    if len(sys.argv) > 1 and sys.argv[1] == "loadtest-backend":
+        from .loadtest import loadtest_main
+        asyncio.run(loadtest_main(sys.argv[2:]))
+        return
+
     asyncio.run(main())
 
 
@@ -0,0 +1,150 @@
+"""Local control socket for runtime changes to a running client."""
+
+import asyncio
+from typing import Optional
+
+from .net.ws import GambiarraClient
+from .output import print_info, print_success, print_warning
+from .runners import Runner
+
+
+class ControlServer:
+    """Line based control server listening on localhost.
+
+    Commands:
+        model <name>   Preload <name>, switch to it between rounds and unload the old model
+        status         Show the current model
+    """
+
+    def __init__(
+        self,
+        port: int,
+        client: GambiarraClient,
+        runner: Runner,
+        round_lock: asyncio.Lock,
+        host: str = "127.0.0.1"
+    ):
+        self.host = host
+        self.port = port
+        self.client = client
+        self.runner = runner
+        self.round_lock = round_lock
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._swap_lock = asyncio.Lock()
+
+    async def start(self) -> None:
+        """Start listening for control connections."""
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+
+    async def stop(self) -> None:
+        """Stop the control server."""
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle_connection(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter
+    ) -> None:
+        """Read commands from a control connection, one per line."""
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+
+                try:
+                    command = line.decode("utf-8").strip()
+                    if not command:
+                        continue
+                    reply = await self._handle_command(command)
+                except Exception as e:
+                    reply = f"error {e}"
+
+                writer.write(f"{reply}\n".encode("utf-8"))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _handle_command(self, command: str) -> str:
+        """Run a control command and return the reply."""
+        name, _, arg = command.partition(" ")
+        arg = arg.strip()
+
+        if name == "status":
+            return f"ok model={self.client.config.model}"
+
+        if name == "model":
+            if not arg:
+                return "error usage: model <name>"
+            acknowledged = await self.swap_model(arg)
+            if not acknowledged:
+                return f"ok model={arg} (not confirmed by arena)"
+            return f"ok model={arg}"
+
+        return f"error unknown command: {name}"
+
+    async def swap_model(self, model: str) -> bool:
+        """Switch to a new model without dropping the arena connection.
+
+        Returns whether the arena acknowledged the new registration. If the arena
+        rejects it, the previous model is restored and the exception is re-raised.
+        """
+        async with self._swap_lock:
+            old_model = self.client.config.model
+            if model == old_model:
+                return True
+
+            print_info(f"Preloading model {model}...")
+            # The current model keeps serving rounds while the new one loads
+            await self.runner.load_model(model)
+
+            # Switch between rounds so a generation never changes model midway
+            async with self.round_lock:
+                self._set_model(model)
+
+            # Wait for the arena outside the round lock, so a round can start meanwhile
+            try:
+                acknowledged = await self.client.reregister()
+            except Exception:
+                async with self.round_lock:
+                    self._set_model(old_model)
+                await self._reannounce(old_model)
+                await self._unload(model)
+                raise
+
+            if acknowledged:
+                print_success(f"Switched model {old_model} -> {model}")
+            else:
+                print_warning(f"Switched model {old_model} -> {model}, arena did not confirm")
+
+            await self._unload(old_model)
+            return acknowledged
+
+    def _set_model(self, model: str) -> None:
+        """Point the runner and the client config at a model."""
+        self.runner.set_model(model)
+        self.client.config.model = model
+
+    async def _reannounce(self, model: str) -> None:
+        """Register the restored model again so the arena and client agree."""
+        try:
+            if not await self.client.reregister():
+                print_warning(f"Arena did not confirm restored model {model}")
+        except Exception as e:
+            print_warning(f"Failed to re-announce model {model}: {e}")
+
+    async def _unload(self, model: str) -> None:
+        """Unload a model, warning instead of failing."""
+        try:
+            await self.runner.unload_model(model)
+        except Exception as e:
+            print_warning(f"Failed to unload model {model}: {e}")
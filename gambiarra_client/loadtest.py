@@ -0,0 +1,263 @@
+"""Local backend saturation benchmark for Gambiarra runners."""
+
+import argparse
+import asyncio
+import csv
+import json
+import math
+import os
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from .cli import create_runner, load_env_file
+from .output import Colors, print_error, print_info, print_success, print_warning
+from .runners import Runner, GenerateOptions
+
+
+# Minimum throughput gain over the previous level to count as still scaling
+SCALING_THRESHOLD = 0.10
+
+# Minimum requests per level, so TTFT percentiles have enough samples
+MIN_REQUESTS_PER_LEVEL = 20
+
+OUTPUT_FORMATS = (".csv", ".json")
+
+
+@dataclass
+class RequestResult:
+    """Result of a single generation request."""
+    tokens: int
+    duration_ms: int
+    latency_ms_first_token: Optional[int]
+    error: Optional[str] = None
+
+
+@dataclass
+class LevelResult:
+    """Aggregated results for one concurrency level."""
+    concurrency: int
+    requests: int
+    errors: int
+    tokens: int
+    duration_ms: int
+    tokens_per_s: float
+    ttft_p50_ms: Optional[int]
+    ttft_p95_ms: Optional[int]
+
+
+def load_prompts(path: Path) -> List[str]:
+    """Load prompts from a file, one per line (blank lines and # comments skipped)."""
+    prompts = [
+        line.strip()
+        for line in path.read_text(encoding="utf-8").splitlines()
+        if line.strip() and not line.strip().startswith("#")
+    ]
+    if not prompts:
+        raise ValueError(f"No prompts found in {path}")
+    return prompts
+
+
+def parse_levels(value: str) -> List[int]:
+    """Parse a comma separated list of concurrency levels."""
+    try:
+        levels = sorted({int(level) for level in value.split(",") if level.strip()})
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid concurrency levels: {value}")
+    if not levels or levels[0] < 1:
+        raise argparse.ArgumentTypeError(f"Invalid concurrency levels: {value}")
+    return levels
+
+
+def positive_int(value: str) -> int:
+    """Parse a strictly positive integer."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid positive integer: {value}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"Invalid positive integer: {value}")
+    return number
+
+
+def percentile(values: Sequence[int], pct: float) -> Optional[int]:
+    """Return the nearest-rank percentile of values."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+async def run_request(runner: Runner, prompt: str, options: GenerateOptions) -> RequestResult:
+    """Run a single challenge against the runner and time it."""
+    tokens = 0
+    start = time.monotonic()
+    first_token: Optional[float] = None
+
+    def on_token(token: str):
+        nonlocal tokens, first_token
+        if first_token is None:
+            first_token = time.monotonic()
+        tokens += 1
+
+    error = None
+    try:
+        await runner.generate(prompt, options, on_token)
+    except Exception as e:
+        error = str(e)
+
+    duration_ms = int((time.monotonic() - start) * 1000)
+    latency_ms_first_token = None
+    if first_token is not None:
+        latency_ms_first_token = int((first_token - start) * 1000)
+
+    return RequestResult(tokens, duration_ms, latency_ms_first_token, error)
+
+
+async def run_level(
+    runner: Runner,
+    prompts: List[str],
+    concurrency: int,
+    requests: int,
+    options: GenerateOptions
+) -> LevelResult:
+    """Fire requests at the runner with at most `concurrency` in flight."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def limited(index: int) -> RequestResult:
+        async with semaphore:
+            return await run_request(runner, prompts[index % len(prompts)], options)
+
+    start = time.monotonic()
+    results = await asyncio.gather(*(limited(i) for i in range(requests)))
+    duration_ms = int((time.monotonic() - start) * 1000)
+
+    tokens = sum(result.tokens for result in results)
+    ttfts = [r.latency_ms_first_token for r in results if r.latency_ms_first_token is not None]
+
+    return LevelResult(
+        concurrency=concurrency,
+        requests=requests,
+        errors=sum(1 for result in results if result.error),
+        tokens=tokens,
+        duration_ms=duration_ms,
+        tokens_per_s=round(tokens / (duration_ms / 1000), 2) if duration_ms else 0.0,
+        ttft_p50_ms=percentile(ttfts, 50),
+        ttft_p95_ms=percentile(ttfts, 95),
+    )
+
+
+def find_saturation(levels: List[LevelResult]) -> Optional[int]:
+    """Return the last concurrency level that still improved throughput."""
+    if not levels:
+        return None
+
+    best = levels[0]
+    for level in levels[1:]:
+        if level.tokens_per_s < best.tokens_per_s * (1 + SCALING_THRESHOLD):
+            break
+        best = level
+    return best.concurrency
+
+
+def write_results(
+    path: Path,
+    args: argparse.Namespace,
+    levels: List[LevelResult],
+    saturation: Optional[int]
+) -> None:
+    """Write the saturation curve as CSV or JSON, based on the file extension."""
+    suffix = path.suffix.lower()
+    if suffix not in OUTPUT_FORMATS:
+        raise ValueError(f"Unsupported output format: {path.suffix or path.name}")
+
+    if suffix == ".csv":
+        fieldnames = list(LevelResult.__dataclass_fields__) + ["saturation_concurrency"]
+        with path.open("w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            for level in levels:
+                writer.writerow({**asdict(level), "saturation_concurrency": saturation})
+        return
+
+    report = {
+        "runner": args.runner,
+        "model": args.model,
+        "max_tokens": args.max_tokens,
+        "saturation_concurrency": saturation,
+        "levels": [asdict(level) for level in levels],
+    }
+    path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+
+async def loadtest_main(argv: Optional[List[str]] = None):
+    """Entry point for `gambiarra-client loadtest-backend`."""
+    load_env_file()
+
+    parser = argparse.ArgumentParser(
+        prog="gambiarra-client loadtest-backend",
+        description="Mede a saturação do backend local em níveis crescentes de concorrência",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+
+    parser.add_argument("prompts", type=Path, help="File with one prompt per line")
+    parser.add_argument("--runner", default=os.getenv("RUNNER", "ollama"), choices=["ollama", "lmstudio", "mock"], help="Runner type")
+    parser.add_argument("--model", default=os.getenv("MODEL", "llama3.1:8b"), help="Model name")
+    parser.add_argument("--temperature", type=float, default=float(os.getenv("TEMPERATURE", "0.8")), help="Temperature")
+    parser.add_argument("--max-tokens", type=int, default=int(os.getenv("MAX_TOKENS", "400")), help="Max tokens")
+    parser.add_argument("--ollama-url", default=os.getenv("OLLAMA_URL", "http://localhost:11434"), help="Ollama API URL")
+    parser.add_argument("--lmstudio-url", default=os.getenv("LMSTUDIO_URL", "http://localhost:1234"), help="LM Studio API URL")
+    parser.add_argument("--concurrency", type=parse_levels, default="1,2,4,8", help="Comma separated concurrency levels")
+    parser.add_argument("--requests-per-level", type=positive_int, default=None, help=f"Requests per level (default: max({MIN_REQUESTS_PER_LEVEL}, 4x the concurrency))")
+    parser.add_argument("--output", type=Path, default=Path("saturation.json"), help="Output file (.csv or .json)")
+
+    args = parser.parse_args(argv)
+
+    if args.output.suffix.lower() not in OUTPUT_FORMATS:
+        parser.error(f"--output must end in {' or '.join(OUTPUT_FORMATS)}")
+
+    try:
+        prompts = load_prompts(args.prompts)
+    except (OSError, ValueError) as e:
+        print_error(f"Failed to load prompts: {e}")
+        sys.exit(1)
+
+    print(f"{Colors.BOLD}{Colors.CYAN}\n📈 Gambiarra Backend Load Test\n{Colors.END}")
+    runner = await create_runner(args)
+
+    options = GenerateOptions(max_tokens=args.max_tokens, temperature=args.temperature)
+
+    # Untimed warm-up so the cold model load is not counted in the first level
+    print_info("Warming up...")
+    warmup = await run_request(runner, prompts[0], options)
+    if warmup.error:
+        print_error(f"Warm-up failed: {warmup.error}")
+        sys.exit(1)
+
+    levels: List[LevelResult] = []
+    for concurrency in args.concurrency:
+        requests = args.requests_per_level
+        if requests is None:
+            requests = max(MIN_REQUESTS_PER_LEVEL, concurrency * 4)
+        print_info(f"Concurrency {concurrency}: {requests} requests...")
+
+        level = await run_level(runner, prompts, concurrency, requests, options)
+        levels.append(level)
+
+        print(
+            f"  {level.tokens_per_s:.1f} tok/s, "
+            f"TTFT p50 {level.ttft_p50_ms}ms / p95 {level.ttft_p95_ms}ms, "
+            f"{level.errors} errors"
+        )
+
+    saturation = find_saturation(levels)
+    write_results(args.output, args, levels, saturation)
+
+    print_success(f"Results written to {args.output}")
+    if saturation == levels[-1].concurrency:
+        print_warning(f"Backend still scaling at concurrency {saturation}, try higher levels")
+    elif saturation is not None:
+        print_success(f"Backend stops scaling after concurrency {saturation}")
@@ -3,7 +3,7 @@
 import asyncio
 import json
 import websockets
-from typing import Any, Dict, Optional, Callable
+from typing import Any, Dict, Optional, Callable, Set
 from dataclasses import dataclass
 from enum import Enum
 
@@ -78,6 +78,8 @@ class GambiarraClient:
         self.max_reconnect_attempts = 5
         self.reconnect_delay = 1.0
         self.running = False
+        self._pending_registration: Optional[asyncio.Future] = None
+        self._challenge_tasks: Set[asyncio.Task] = set()
 
         # Event handlers
         self._on_challenge: Optional[Callable[[Challenge], None]] = None
@@ -101,14 +103,7 @@ class GambiarraClient:
             self.running = True
 
             # Send registration
-            await self._send({
-                "type": MessageType.REGISTER,
-                "participant_id": self.config.participant_id,
-                "nickname": self.config.nickname,
-                "pin": self.config.pin,
-                "runner": self.config.runner,
-                "model": self.config.model,
-            })
+            await self._register()
 
             # Start message loop
             asyncio.create_task(self._message_loop())
@@ -116,6 +111,41 @@ class GambiarraClient:
         except Exception as e:
             raise Exception(f"Failed to connect: {e}")
 
+    async def _register(self) -> None:
+        """Send registration with the current config."""
+        await self._send({
+            "type": MessageType.REGISTER,
+            "participant_id": self.config.participant_id,
+            "nickname": self.config.nickname,
+            "pin": self.config.pin,
+            "runner": self.config.runner,
+            "model": self.config.model,
+        })
+
+    async def reregister(self, timeout: float = 5.0) -> bool:
+        """Re-send registration on the current connection and wait for the arena's reply.
+
+        Returns False if the arena did not answer in time, raises if it answered with an error.
+        """
+        self._pending_registration = asyncio.get_running_loop().create_future()
+        try:
+            await self._register()
+            return await asyncio.wait_for(self._pending_registration, timeout)
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._pending_registration = None
+
+    def _resolve_registration(self, error: Optional[str] = None) -> None:
+        """Complete a pending re-registration, if any."""
+        future = self._pending_registration
+        if future is None or future.done():
+            return
+        if error is None:
+            future.set_result(True)
+        else:
+            future.set_exception(Exception(f"Arena rejected registration: {error}"))
+
     async def _message_loop(self) -> None:
         """Listen for messages from server."""
         try:
@@ -145,18 +175,25 @@ class GambiarraClient:
                     deadline_ms=message["deadline_ms"],
                     seed=message.get("seed"),
                 )
-                await self._on_challenge(challenge)
+                # Run the round in its own task so the loop keeps reading replies
+                task = asyncio.create_task(self._on_challenge(challenge))
+                self._challenge_tasks.add(task)
+                task.add_done_callback(self._challenge_tasks.discard)
 
         elif msg_type == MessageType.HEARTBEAT:
             # Respond to heartbeat if needed
             pass
 
         elif msg_type == MessageType.REGISTERED:
+            self._resolve_registration()
             if self._on_registered:
                 self._on_registered(message)
 
         elif msg_type == MessageType.ERROR:
             print(f"Server error: {message.get('message')}")
+            # Errors about a round's tokens or completion are not a registration reply
+            if message.get("round") is None:
+                self._resolve_registration(message.get("message") or "unknown error")
 
         else:
             print(f"Unknown message type: {msg_type}")
@@ -0,0 +1,37 @@
+"""Terminal output helpers for Gambiarra LLM Club Client."""
+
+
+# ANSI color codes for terminal output
+class Colors:
+    CYAN = '\033[96m'
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    RED = '\033[91m'
+    GRAY = '\033[90m'
+    BOLD = '\033[1m'
+    END = '\033[0m'
+
+
+def print_banner():
+    """Print startup banner."""
+    print(f"{Colors.BOLD}{Colors.CYAN}\n🎮 Gambiarra LLM Club Client\n{Colors.END}")
+
+
+def print_success(message: str):
+    """Print success message."""
+    print(f"{Colors.GREEN}✓ {message}{Colors.END}")
+
+
+def print_error(message: str):
+    """Print error message."""
+    print(f"{Colors.RED}✗ {message}{Colors.END}")
+
+
+def print_info(message: str):
+    """Print info message."""
+    print(f"{Colors.GRAY}{message}{Colors.END}")
+
+
+def print_warning(message: str):
+    """Print warning message."""
+    print(f"{Colors.YELLOW}{message}{Colors.END}")
@@ -2,6 +2,7 @@
 
 import aiohttp
 import json
+from typing import Any, Dict
 from .types import Runner, GenerateOptions, TokenCallback
 
 
@@ -19,6 +20,20 @@ class LMStudioRunner(Runner):
                 if not response.ok:
                     raise Exception(f"LM Studio not available at {self.base_url}")
 
+    def set_model(self, model: str) -> None:
+        """Switch the model used for generation."""
+        self.model = model
+
+    async def load_model(self, model: str) -> None:
+        """Load a model in LM Studio with a one token completion."""
+        payload = {"model": model, "prompt": "", "max_tokens": 1, "stream": False}
+
+        async with aiohttp.ClientSession() as session:
+            async with session.post(f"{self.base_url}/v1/completions", json=payload) as response:
+                if not response.ok:
+                    raise Exception(f"LM Studio API error: {response.status}")
+                await response.read()
+
     async def generate(
         self,
         prompt: str,
@@ -26,12 +41,16 @@ class LMStudioRunner(Runner):
         on_token: TokenCallback
     ) -> None:
         """Generate text using LM Studio API with streaming."""
+        self.last_cached_prompt_tokens = None
+
         payload = {
             "model": self.model,
             "prompt": prompt,
             "max_tokens": options.max_tokens or 400,
             "temperature": options.temperature or 0.8,
             "stream": True,
+            # Final usage chunk carries the cached prompt token hint
+            "stream_options": {"include_usage": True},
         }
 
         if options.seed is not None:
@@ -60,8 +79,18 @@ class LMStudioRunner(Runner):
 
                     try:
                         data = json.loads(data_str)
-                        token = data.get("choices", [{}])[0].get("text")
+                        if data.get("usage"):
+                            self._record_usage(data["usage"])
+                        choices = data.get("choices") or [{}]
+                        token = choices[0].get("text")
                         if token:
                             on_token(token)
                     except json.JSONDecodeError as e:
                         print(f"Failed to parse LM Studio response: {e}")
+
+    def _record_usage(self, usage: Dict[str, Any]) -> None:
+        """Record the prompt tokens LM Studio served from its cache."""
+        details = usage.get("prompt_tokens_details") or {}
+        cached_tokens = details.get("cached_tokens")
+        if cached_tokens is not None:
+            self.last_cached_prompt_tokens = cached_tokens
@@ -2,15 +2,22 @@
 
 import aiohttp
 import json
+from typing import Any, Dict, Optional
 from .types import Runner, GenerateOptions, TokenCallback
 
 
+# Keep the model, and with it the KV cache of the last prompt, loaded between rounds
+KEEP_ALIVE = "30m"
+
+
 class OllamaRunner(Runner):
     """Runner for Ollama API."""
 
     def __init__(self, base_url: str, model: str):
         self.base_url = base_url
         self.model = model
+        # Per-token prompt evaluation cost of the first round, the cold baseline
+        self._cold_ns_per_prompt_token: Optional[float] = None
 
     async def test(self) -> None:
         """Test if Ollama is available."""
@@ -19,6 +26,29 @@ class OllamaRunner(Runner):
                 if not response.ok:
                     raise Exception(f"Ollama not available at {self.base_url}")
 
+    def set_model(self, model: str) -> None:
+        """Switch the model used for generation."""
+        self.model = model
+        self._cold_ns_per_prompt_token = None
+
+    async def load_model(self, model: str) -> None:
+        """Load a model in Ollama without generating."""
+        await self._set_keep_alive(model, KEEP_ALIVE)
+
+    async def unload_model(self, model: str) -> None:
+        """Unload a model from Ollama."""
+        await self._set_keep_alive(model, 0)
+
+    async def _set_keep_alive(self, model: str, keep_alive: Any) -> None:
+        """Send an empty generate request, which only loads or unloads the model."""
+        payload = {"model": model, "keep_alive": keep_alive}
+
+        async with aiohttp.ClientSession() as session:
+            async with session.post(f"{self.base_url}/api/generate", json=payload) as response:
+                if not response.ok:
+                    raise Exception(f"Ollama API error: {response.status}")
+                await response.read()
+
     async def generate(
         self,
         prompt: str,
@@ -26,19 +56,19 @@ class OllamaRunner(Runner):
         on_token: TokenCallback
     ) -> None:
         """Generate text using Ollama API with streaming."""
+        self.last_prompt_eval_saved_ms = None
+        self.last_cached_prompt_tokens = None
+
         payload = {
             "model": self.model,
             "prompt": prompt,
             "stream": True,
-            "options": {
-                "num_predict": options.max_tokens or 400,
-                "temperature": options.temperature or 0.8,
-            }
+            "options": self._build_options(options),
+            # Ollama reuses the KV cache for a prompt prefix shared with the previous
+            # round on its own, as long as the model stays loaded
+            "keep_alive": KEEP_ALIVE,
         }
 
-        if options.seed is not None:
-            payload["options"]["seed"] = options.seed
-
         async with aiohttp.ClientSession() as session:
             async with session.post(
                 f"{self.base_url}/api/generate",
@@ -57,6 +87,47 @@ class OllamaRunner(Runner):
                         if "response" in data:
                             on_token(data["response"])
                         if data.get("done"):
+                            self._record_prompt_eval(data)
                             return
                     except json.JSONDecodeError as e:
                         print(f"Failed to parse Ollama response: {e}")
+
+    def _build_options(self, options: GenerateOptions) -> Dict[str, Any]:
+        """Build Ollama generation options."""
+        ollama_options: Dict[str, Any] = {
+            "num_predict": options.max_tokens or 400,
+            "temperature": options.temperature or 0.8,
+        }
+
+        if options.seed is not None:
+            ollama_options["seed"] = options.seed
+
+        return ollama_options
+
+    def _record_prompt_eval(self, data: Dict[str, Any]) -> None:
+        """Record prompt tokens reused from the KV cache and the evaluation time saved.
+
+        Depending on the Ollama version, prompt_eval_count either excludes the tokens
+        reused from the KV cache or counts the whole prompt, so the saving is measured
+        from prompt_eval_duration against the cold per-token cost of the first round.
+        """
+        evaluated = data.get("prompt_eval_count") or 0
+        duration = data.get("prompt_eval_duration") or 0
+        if not evaluated or not duration:
+            return
+
+        # The returned context holds the full templated prompt followed by the generated tokens
+        prompt_tokens = evaluated
+        context = data.get("context")
+        if context:
+            prompt_tokens = max(evaluated, len(context) - (data.get("eval_count") or 0))
+
+        if prompt_tokens > evaluated:
+            self.last_cached_prompt_tokens = prompt_tokens - evaluated
+
+        if self._cold_ns_per_prompt_token is None:
+            self._cold_ns_per_prompt_token = duration / prompt_tokens
+            return
+
+        saved_ns = prompt_tokens * self._cold_ns_per_prompt_token - duration
+        self.last_prompt_eval_saved_ms = max(0, int(saved_ns / 1_000_000))
@@ -20,6 +20,11 @@ TokenCallback = Callable[[str], None]
 class Runner(ABC):
     """Abstract base class for LLM runners."""
 
+    # Prompt tokens served from the backend cache in the last generation, and the
+    # evaluation time this saved when the backend reports it
+    last_cached_prompt_tokens: Optional[int] = None
+    last_prompt_eval_saved_ms: Optional[int] = None
+
     @abstractmethod
     async def test(self) -> None:
         """Test if the runner is available and working."""
@@ -34,3 +39,15 @@ class Runner(ABC):
     ) -> None:
         """Generate text with streaming."""
         pass
+
+    def set_model(self, model: str) -> None:
+        """Switch the model used for generation."""
+        pass
+
+    async def load_model(self, model: str) -> None:
+        """Load a model in the backend ahead of use."""
+        pass
+
+    async def unload_model(self, model: str) -> None:
+        """Unload a model from the backend to free memory."""
+        pass
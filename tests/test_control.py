@@ -0,0 +1,113 @@
+"""Tests for runtime model hot-swap."""
+
+import asyncio
+
+import pytest
+
+from gambiarra_client.control import ControlServer
+from gambiarra_client.net.ws import ClientConfig, GambiarraClient
+from gambiarra_client.runners import MockRunner
+
+
+class FakeRunner(MockRunner):
+    """Mock runner that records model changes."""
+
+    def __init__(self, model: str):
+        self.model = model
+        self.unloaded = []
+
+    def set_model(self, model: str) -> None:
+        self.model = model
+
+    async def load_model(self, model: str) -> None:
+        pass
+
+    async def unload_model(self, model: str) -> None:
+        self.unloaded.append(model)
+
+
+def make_client(replies):
+    """Client whose server answers each REGISTER with the next queued replies."""
+    client = GambiarraClient(ClientConfig("ws://arena", "p1", "Nick", "1234", "ollama", "old"))
+    client.registered_models = []
+
+    async def send(data):
+        client.registered_models.append(data["model"])
+        for reply in replies.pop(0) if replies else []:
+            asyncio.get_running_loop().call_soon(
+                asyncio.ensure_future, client._handle_message(reply)
+            )
+
+    client._send = send
+    return client
+
+
+def test_swap_is_confirmed_by_registered():
+    async def scenario():
+        client = make_client([[{"type": "registered"}]])
+        runner = FakeRunner("old")
+        server = ControlServer(0, client, runner, asyncio.Lock())
+
+        assert await server.swap_model("new") is True
+        assert (runner.model, client.config.model) == ("new", "new")
+        assert runner.unloaded == ["old"]
+
+    asyncio.run(scenario())
+
+
+def test_round_error_is_not_a_registration_reply():
+    async def scenario():
+        late_error = {"type": "error", "round": 3, "message": "round closed"}
+        client = make_client([[late_error, {"type": "registered"}]])
+        runner = FakeRunner("old")
+        server = ControlServer(0, client, runner, asyncio.Lock())
+
+        assert await server.swap_model("new") is True
+        assert client.config.model == "new"
+
+    asyncio.run(scenario())
+
+
+def test_rejection_restores_and_reannounces_old_model():
+    async def scenario():
+        rejection = {"type": "error", "message": "already registered"}
+        client = make_client([[rejection], [{"type": "registered"}]])
+        runner = FakeRunner("old")
+        server = ControlServer(0, client, runner, asyncio.Lock())
+
+        with pytest.raises(Exception, match="already registered"):
+            await server.swap_model("new")
+
+        assert (runner.model, client.config.model) == ("old", "old")
+        assert client.registered_models == ["new", "old"]
+        assert runner.unloaded == ["new"]
+
+    asyncio.run(scenario())
+
+
+def test_challenge_does_not_block_message_loop():
+    async def scenario():
+        client = make_client([])
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def on_challenge(challenge):
+            started.set()
+            await release.wait()
+
+        client.on("challenge", on_challenge)
+        challenge = {
+            "type": "challenge",
+            "session_id": "s1",
+            "round": 1,
+            "prompt": "Escreva um poema",
+            "max_tokens": 10,
+            "temperature": 0.8,
+            "deadline_ms": 1000,
+        }
+
+        await asyncio.wait_for(client._handle_message(challenge), 1)
+        await asyncio.wait_for(started.wait(), 1)
+        release.set()
+
+    asyncio.run(scenario())
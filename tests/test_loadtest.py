@@ -0,0 +1,105 @@
+"""Tests for the backend load test helpers."""
+
+import argparse
+import csv
+import json
+
+import pytest
+
+from gambiarra_client.loadtest import (
+    LevelResult,
+    find_saturation,
+    parse_levels,
+    percentile,
+    positive_int,
+    write_results,
+)
+
+
+def level(concurrency, tokens_per_s):
+    return LevelResult(
+        concurrency=concurrency,
+        requests=20,
+        errors=0,
+        tokens=400,
+        duration_ms=1000,
+        tokens_per_s=tokens_per_s,
+        ttft_p50_ms=50,
+        ttft_p95_ms=90,
+    )
+
+
+def args():
+    return argparse.Namespace(runner="ollama", model="llama3.1:8b", max_tokens=400)
+
+
+def test_percentile_is_nearest_rank():
+    assert percentile(list(range(1, 31)), 95) == 29
+    assert percentile(list(range(1, 31)), 50) == 15
+    assert percentile([1, 2], 50) == 1
+    assert percentile([7], 95) == 7
+
+
+def test_percentile_of_empty_values():
+    assert percentile([], 50) is None
+
+
+def test_parse_levels_sorts_and_dedupes():
+    assert parse_levels("4, 1,2,4") == [1, 2, 4]
+
+
+@pytest.mark.parametrize("value", ["", "0,1", "a,2", "-1"])
+def test_parse_levels_rejects_invalid(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_levels(value)
+
+
+@pytest.mark.parametrize("value", ["0", "-3", "x"])
+def test_positive_int_rejects_invalid(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        positive_int(value)
+
+
+def test_positive_int():
+    assert positive_int("20") == 20
+
+
+def test_find_saturation_stops_when_gain_is_below_threshold():
+    levels = [level(1, 100.0), level(2, 190.0), level(4, 200.0), level(8, 400.0)]
+
+    assert find_saturation(levels) == 2
+
+
+def test_find_saturation_when_still_scaling():
+    assert find_saturation([level(1, 100.0), level(2, 200.0)]) == 2
+
+
+def test_find_saturation_without_levels():
+    assert find_saturation([]) is None
+
+
+def test_write_results_csv(tmp_path):
+    path = tmp_path / "out.csv"
+    write_results(path, args(), [level(1, 100.0), level(2, 190.0)], 2)
+
+    with path.open(newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+
+    assert [row["concurrency"] for row in rows] == ["1", "2"]
+    assert all(row["saturation_concurrency"] == "2" for row in rows)
+
+
+def test_write_results_json(tmp_path):
+    path = tmp_path / "out.json"
+    write_results(path, args(), [level(1, 100.0)], 1)
+
+    report = json.loads(path.read_text(encoding="utf-8"))
+
+    assert report["saturation_concurrency"] == 1
+    assert report["model"] == "llama3.1:8b"
+    assert report["levels"][0]["tokens_per_s"] == 100.0
+
+
+def test_write_results_rejects_unknown_extension(tmp_path):
+    with pytest.raises(ValueError):
+        write_results(tmp_path / "out.txt", args(), [level(1, 100.0)], 1)
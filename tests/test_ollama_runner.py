@@ -0,0 +1,77 @@
+"""Tests for the Ollama runner's prompt evaluation stats."""
+
+from gambiarra_client.runners import OllamaRunner
+
+
+def final_chunk(prompt_tokens, evaluated, duration_ns, generated=3):
+    """Build a final /api/generate stream chunk as documented by Ollama."""
+    return {
+        "model": "llama3.1:8b",
+        "created_at": "2026-10-19T12:00:00.000000Z",
+        "response": "",
+        "done": True,
+        "done_reason": "stop",
+        "context": list(range(prompt_tokens + generated)),
+        "total_duration": duration_ns + 500_000_000,
+        "load_duration": 10_000_000,
+        "prompt_eval_count": evaluated,
+        "prompt_eval_duration": duration_ns,
+        "eval_count": generated,
+        "eval_duration": 400_000_000,
+    }
+
+
+def test_first_round_sets_cold_baseline():
+    runner = OllamaRunner("http://localhost:11434", "llama3.1:8b")
+    runner._record_prompt_eval(final_chunk(100, 100, 200_000_000))
+
+    assert runner.last_prompt_eval_saved_ms is None
+    assert runner.last_cached_prompt_tokens is None
+
+
+def test_saving_when_prompt_eval_count_is_full_prompt():
+    runner = OllamaRunner("http://localhost:11434", "llama3.1:8b")
+    runner._record_prompt_eval(final_chunk(100, 100, 200_000_000))  # 2ms per token cold
+
+    runner._record_prompt_eval(final_chunk(150, 150, 60_000_000))
+
+    assert runner.last_prompt_eval_saved_ms == 240
+    assert runner.last_cached_prompt_tokens is None
+
+
+def test_saving_when_prompt_eval_count_excludes_cached_tokens():
+    runner = OllamaRunner("http://localhost:11434", "llama3.1:8b")
+    runner._record_prompt_eval(final_chunk(100, 100, 200_000_000))
+
+    runner._record_prompt_eval(final_chunk(150, 30, 60_000_000))
+
+    assert runner.last_cached_prompt_tokens == 120
+    assert runner.last_prompt_eval_saved_ms == 240
+
+
+def test_slower_round_reports_no_saving():
+    runner = OllamaRunner("http://localhost:11434", "llama3.1:8b")
+    runner._record_prompt_eval(final_chunk(100, 100, 200_000_000))
+
+    runner._record_prompt_eval(final_chunk(100, 100, 300_000_000))
+
+    assert runner.last_prompt_eval_saved_ms == 0
+
+
+def test_chunk_without_prompt_stats_is_ignored():
+    runner = OllamaRunner("http://localhost:11434", "llama3.1:8b")
+    chunk = final_chunk(100, 100, 200_000_000)
+    del chunk["prompt_eval_count"]
+
+    runner._record_prompt_eval(chunk)
+
+    assert runner._cold_ns_per_prompt_token is None
+
+
+def test_set_model_resets_cold_baseline():
+    runner = OllamaRunner("http://localhost:11434", "llama3.1:8b")
+    runner._record_prompt_eval(final_chunk(100, 100, 200_000_000))
+
+    runner.set_model("qwen2.5:7b")
+
+    assert runner._cold_ns_per_prompt_token is None